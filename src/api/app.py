@@ -1,19 +1,67 @@
 # src/api/app.py
 
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Query, HTTPException
 from pydantic import BaseModel
 
 from src.api.admin import router as admin_router
 
 from src.rag.rag_pipeline import RAGPipeline
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, JSONResponse
+
+logger = logging.getLogger(__name__)
+
+# The RAG pipeline is built and warmed up in a background thread so the
+# server accepts connections (and answers /healthz) immediately.
+pipeline: RAGPipeline | None = None
+_ready = threading.Event()
+_failed = threading.Event()
+# Init exceptions are only logged; clients get this generic detail
+INIT_FAILED_DETAIL = "pipeline init failed"
+_init_error: str | None = None
+
+# Init attempts before giving up; backoff doubles after each failure
+INIT_ATTEMPTS = 5
+INIT_BACKOFF_S = 2.0
 
+def _init_pipeline():
+    global pipeline, _init_error
+    delay = INIT_BACKOFF_S
+    for attempt in range(1, INIT_ATTEMPTS + 1):
+        try:
+            p = RAGPipeline()
+            p.warmup()
+            break
+        except Exception:
+            _init_error = INIT_FAILED_DETAIL
+            logger.exception("Pipeline init failed (attempt %d/%d)", attempt, INIT_ATTEMPTS)
+            if attempt == INIT_ATTEMPTS:
+                # Fail liveness so the orchestrator restarts this worker
+                _failed.set()
+                return
+            time.sleep(delay)
+            delay *= 2
+    pipeline = p
+    _init_error = None
+    _ready.set()
+    # Connection warmup must not hold back readiness
+    p.warmup_upstream()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    threading.Thread(target=_init_pipeline, name="rag-init", daemon=True).start()
+    yield
 
 
 app = FastAPI(
     title="Multilingual RAG API - Polyglot",
     version="0.1",
-    description="Retrieve & generate answers over a Bangla/English corpus"
+    description="Retrieve & generate answers over a Bangla/English corpus",
+    lifespan=lifespan
 )
 
 # Include admin endpoints
@@ -22,10 +70,23 @@ app.include_router(admin_router)
 @app.get("/", include_in_schema=False)
 def root():
     return RedirectResponse(url="/docs")
-  
 
-# Initialize the RAG pipeline once
-pipeline = RAGPipeline()
+
+@app.get("/healthz", include_in_schema=False)
+def healthz():
+    """Liveness: the process is serving and pipeline init has not given up."""
+    if _failed.is_set():
+        return JSONResponse(status_code=503, content={"status": "failed", "detail": _init_error})
+    return {"status": "ok"}
+
+@app.get("/readyz", include_in_schema=False)
+def readyz():
+    """Readiness: the pipeline is loaded and warmed up."""
+    if _ready.is_set():
+        return {"status": "ready"}
+    if _failed.is_set():
+        return JSONResponse(status_code=503, content={"status": "failed", "detail": _init_error})
+    return JSONResponse(status_code=503, content={"status": "starting", "detail": _init_error})
 
 # Response model
 class ContextItem(BaseModel):
@@ -50,6 +111,8 @@ def ask(
     - q: question text (Bangla or English)
     - k: how many context snippets to fetch (1–10)
     """
+    if not _ready.is_set():
+        raise HTTPException(status_code=503, detail=_init_error or "Pipeline is still starting up.")
     try:
         result = pipeline(q, top_k=k)
         return result
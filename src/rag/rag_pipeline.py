@@ -1,13 +1,21 @@
 # src/rag/rag_pipeline.py
 
+import sys
 import yaml
 import json
+import logging
 from pathlib import Path
+# Ensure project root is on PYTHONPATH
+sys.path.insert(0, str(Path(__file__).parents[2]))
 from groq import Groq
 import faiss
 import numpy as np
 from huggingface_hub import InferenceClient
 
+from src.vector_store.indexer import MappedMetadata, offsets_path
+
+logger = logging.getLogger(__name__)
+
 class RAGPipeline:
     def __init__(
         self,
@@ -39,15 +47,81 @@ class RAGPipeline:
         self.history: list[dict] = []
 
         # Initialize embedding client (HF)
+        self.hf_model = hf_model
         self.embedder = InferenceClient(model=hf_model, token=self.hf_token)
 
-        # Load FAISS index and metadata
-        self.index = faiss.read_index(str(index_path))
-        self.meta = json.loads(Path(meta_path).read_text(encoding="utf-8"))
+        # FAISS index and metadata are loaded lazily on first use
+        self.index_path = Path(index_path)
+        self.meta_path = Path(meta_path)
+        self._index = None
+        self._meta = None
 
         # Initialize Groq client
         self.groq = Groq(api_key=self.groq_key)
 
+    @property
+    def index(self):
+        # Memory-map the flat index (IO_FLAG_MMAP_IFC, faiss >= 1.11) so worker
+        # processes share the OS page cache instead of each holding a private
+        # copy; fall back to reading it into RAM if mapping fails.
+        if self._index is None:
+            try:
+                self._index = faiss.read_index(str(self.index_path), faiss.IO_FLAG_MMAP_IFC)
+            except RuntimeError as e:
+                logger.warning(
+                    "mmap of %s failed (%s); reading it into RAM",
+                    self.index_path, e
+                )
+                self._index = faiss.read_index(str(self.index_path))
+        return self._index
+
+    @property
+    def meta(self):
+        # Map index position → chunk_id & text, memory-mapped when the
+        # offset sidecar written by the indexer is present
+        if self._meta is None:
+            if offsets_path(self.meta_path).exists():
+                try:
+                    self._meta = MappedMetadata(self.meta_path)
+                except ValueError as e:
+                    logger.warning("%s; parsing the full metadata", e)
+            else:
+                logger.warning(
+                    "No offset table for %s; parsing the full metadata",
+                    self.meta_path
+                )
+            if self._meta is None:
+                self._meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        return self._meta
+
+    def warmup(self):
+        """
+        Load the index and metadata and pre-touch the index pages with a
+        dummy search, so the first real request does not pay for it.
+        """
+        index = self.index
+        _ = self.meta
+        if index.ntotal:
+            probe = np.zeros((1, index.d), dtype="float32")
+            index.search(probe, 1)
+
+    def warmup_upstream(self, timeout: float = 5.0):
+        """
+        Open the HF and Groq connections with a short timeout. Failures are
+        only logged: the clients reconnect on demand.
+        """
+        try:
+            # Shares the huggingface_hub HTTP session with self.embedder
+            hf = InferenceClient(model=self.hf_model, token=self.hf_token, timeout=timeout)
+            hf.feature_extraction(["warmup"])
+        except Exception as e:
+            logger.warning("HF warmup failed: %s", e)
+        try:
+            # with_options() reuses the underlying HTTP client
+            self.groq.with_options(timeout=timeout, max_retries=0).models.list()
+        except Exception as e:
+            logger.warning("Groq warmup failed: %s", e)
+
     def embed_query(self, query: str) -> np.ndarray:
         # Embed the user query via HF feature-extraction
         resp = self.embedder.feature_extraction([query])[0]
@@ -1,8 +1,83 @@
 import faiss
 import numpy as np
 import json
+import mmap
+import os
+import tempfile
 from pathlib import Path
 
+def offsets_path(meta_path: Path) -> Path:
+    # faiss_x.index.meta.json → faiss_x.index.meta.offsets.npy
+    return Path(meta_path).with_suffix(".offsets.npy")
+
+def atomic_write(path: Path, write):
+    """
+    Call write(tmp_path) on a temp file next to path, then os.replace it into
+    place. Readers that already mmap'd the old file keep the old inode.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+def write_metadata(metadata: list[dict], meta_path: Path):
+    """
+    Write metadata as a JSON list plus a sidecar (start, end) byte-offset
+    table, so readers can decode single rows without parsing the whole file.
+    The JSON bytes are identical to json.dumps(metadata).
+    """
+    rows = [json.dumps(m).encode("utf-8") for m in metadata]
+    offsets = np.empty((len(rows), 2), dtype="int64")
+    parts, pos = [b"["], 1
+    for i, row in enumerate(rows):
+        if i:
+            parts.append(b", ")
+            pos += 2
+        offsets[i] = (pos, pos + len(row))
+        parts.append(row)
+        pos += len(row)
+    parts.append(b"]")
+    data = b"".join(parts)
+
+    def save_offsets(tmp):
+        # np.save appends ".npy" to bare paths, so write through a file object
+        with open(tmp, "wb") as f:
+            np.save(f, offsets)
+
+    atomic_write(offsets_path(meta_path), save_offsets)
+    atomic_write(meta_path, lambda tmp: Path(tmp).write_bytes(data))
+
+class MappedMetadata:
+    """
+    Read-only, memory-mapped view of a metadata JSON written by write_metadata.
+    Rows are decoded on access; the pages live in the shared OS page cache.
+    Raises ValueError if the offset table does not match the JSON file.
+    """
+    def __init__(self, meta_path: Path):
+        self.offsets = np.load(offsets_path(meta_path), mmap_mode="r")
+        with Path(meta_path).open("rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.offsets.ndim != 2 or self.offsets.shape[1] != 2:
+            raise ValueError(f"Malformed offset table for {meta_path}")
+        if len(self.offsets):
+            ok = self._buf[:1] == b"[" and self.offsets[-1, 1] + 1 == len(self._buf)
+        else:
+            ok = self._buf[:] == b"[]"
+        if not ok:
+            raise ValueError(f"Offset table does not match {meta_path}")
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, idx: int) -> dict:
+        start, end = self.offsets[idx]
+        return json.loads(self._buf[start:end])
+
 def build_faiss_index(embeddings_json: Path, index_path: Path):
     data = json.loads(embeddings_json.read_text(encoding="utf-8"))
     vectors = np.array([item["vector"] for item in data], dtype="float32")
@@ -13,11 +88,12 @@ def build_faiss_index(embeddings_json: Path, index_path: Path):
     faiss.normalize_L2(vectors)
     index.add(vectors)
     index_path.parent.mkdir(parents=True, exist_ok=True)
-    faiss.write_index(index, str(index_path))
 
-    # Save metadata (map index position → chunk_id & text)
+    # Save metadata (map index position → chunk_id & text) before the index;
+    # every file is swapped in atomically since live workers mmap them
     metadata = [{"chunk_id": ids[i], "text": data[i]["text"]} for i in range(len(ids))]
-    Path(str(index_path) + ".meta.json").write_text(json.dumps(metadata), encoding="utf-8")
+    write_metadata(metadata, Path(str(index_path) + ".meta.json"))
+    atomic_write(index_path, lambda tmp: faiss.write_index(index, tmp))
 
     print(f"Built FAISS index at {index_path} with {index.ntotal} vectors")
 
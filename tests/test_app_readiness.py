@@ -0,0 +1,160 @@
+import json
+import logging
+
+import faiss
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import app as app_module
+from src.rag.rag_pipeline import RAGPipeline
+from src.vector_store.indexer import MappedMetadata, atomic_write, write_metadata
+
+
+class FakePipeline:
+    def warmup(self):
+        pass
+
+    def warmup_upstream(self):
+        pass
+
+    def __call__(self, query, top_k=5):
+        return {"answer": "ok", "contexts": []}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    # TestClient without a `with` block skips the lifespan, so init is driven by hand
+    monkeypatch.setattr(app_module, "pipeline", None)
+    monkeypatch.setattr(app_module, "_init_error", None)
+    monkeypatch.setattr(app_module, "_ready", app_module.threading.Event())
+    monkeypatch.setattr(app_module, "_failed", app_module.threading.Event())
+    monkeypatch.setattr(app_module, "INIT_BACKOFF_S", 0)
+    return TestClient(app_module.app)
+
+
+def test_starting(api):
+    assert api.get("/healthz").status_code == 200
+    r = api.get("/readyz")
+    assert r.status_code == 503
+    assert r.json()["status"] == "starting"
+    assert api.get("/ask", params={"q": "hi"}).status_code == 503
+
+
+def test_ready(api, monkeypatch):
+    monkeypatch.setattr(app_module, "RAGPipeline", FakePipeline)
+    app_module._init_pipeline()
+    assert api.get("/readyz").json() == {"status": "ready"}
+    r = api.get("/ask", params={"q": "hi"})
+    assert r.status_code == 200
+    assert r.json()["answer"] == "ok"
+
+
+def test_retry_then_ready(api, monkeypatch):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("not yet")
+        return FakePipeline()
+
+    monkeypatch.setattr(app_module, "RAGPipeline", flaky)
+    app_module._init_pipeline()
+    assert len(calls) == 3
+    assert api.get("/readyz").status_code == 200
+    assert api.get("/healthz").status_code == 200
+
+
+def test_failed(api, monkeypatch, caplog):
+    def broken():
+        raise RuntimeError("no index")
+
+    monkeypatch.setattr(app_module, "RAGPipeline", broken)
+    with caplog.at_level(logging.ERROR):
+        app_module._init_pipeline()
+    assert "Pipeline init failed" in caplog.text
+    for path in ("/readyz", "/healthz"):
+        r = api.get(path)
+        assert r.status_code == 503
+        assert r.json() == {"status": "failed", "detail": "pipeline init failed"}
+    r = api.get("/ask", params={"q": "hi"})
+    assert r.status_code == 503
+    assert r.json()["detail"] == "pipeline init failed"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    vectors = np.eye(3, 4, dtype="float32")
+    index = faiss.IndexFlatIP(4)
+    index.add(vectors)
+    index_path = tmp_path / "faiss_test.index"
+    faiss.write_index(index, str(index_path))
+    meta = [{"chunk_id": f"chunk_{i:04d}", "text": f"টেক্সট {i}"} for i in range(3)]
+    meta_path = tmp_path / "faiss_test.index.meta.json"
+    write_metadata(meta, meta_path)
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "hf_api: {token: x}\n"
+        "rag_api: {key: x}\n"
+        "summarization: {max_chars: 100, summary_threshold: 0.5}\n"
+    )
+    return RAGPipeline(config, index_path, meta_path), meta
+
+
+def test_write_metadata_matches_json(corpus):
+    pipe, meta = corpus
+    assert json.loads(pipe.meta_path.read_text(encoding="utf-8")) == meta
+    assert pipe.meta_path.read_text(encoding="utf-8") == json.dumps(meta)
+
+
+def test_lazy_mapped_index_and_meta(corpus):
+    pipe, meta = corpus
+    assert pipe._index is None and pipe._meta is None
+    pipe.warmup()
+    assert pipe.index.ntotal == 3
+    assert isinstance(pipe.meta, MappedMetadata)
+    assert [pipe.meta[i] for i in range(len(pipe.meta))] == meta
+
+
+def test_meta_without_offsets(corpus, caplog):
+    pipe, meta = corpus
+    pipe.meta_path.with_suffix(".offsets.npy").unlink()
+    with caplog.at_level(logging.WARNING):
+        assert pipe.meta == meta
+    assert "No offset table" in caplog.text
+
+
+def test_index_mmap_failure_falls_back(corpus, monkeypatch, caplog):
+    pipe, _ = corpus
+    read_index = faiss.read_index
+
+    def no_mmap(path, *flags):
+        if flags:
+            raise RuntimeError("mmap unsupported")
+        return read_index(path)
+
+    monkeypatch.setattr(faiss, "read_index", no_mmap)
+    with caplog.at_level(logging.WARNING):
+        assert pipe.index.ntotal == 3
+    assert "mmap unsupported" in caplog.text
+
+
+def test_rewrite_keeps_mapped_view(corpus):
+    pipe, meta = corpus
+    mapped = pipe.meta
+    index = pipe.index
+    write_metadata([{"chunk_id": "new", "text": "x" * 50}], pipe.meta_path)
+    atomic_write(pipe.index_path, lambda tmp: faiss.write_index(faiss.IndexFlatIP(4), tmp))
+    assert [mapped[i] for i in range(len(mapped))] == meta
+    assert index.ntotal == 3
+    assert not list(pipe.meta_path.parent.glob("*.tmp"))
+
+
+def test_stale_offsets_fall_back(corpus, caplog):
+    pipe, _ = corpus
+    new_meta = [{"chunk_id": "other", "text": "y"}]
+    pipe.meta_path.write_text(json.dumps(new_meta), encoding="utf-8")
+    with caplog.at_level(logging.WARNING):
+        assert pipe.meta == new_meta
+    assert "does not match" in caplog.text